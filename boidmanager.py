@@ -1,32 +1,40 @@
 from boid import Boid
-from point import Point
-from vector import Vector
+from flocking import build_cell_list, flock_step, grid_neighbors, set_kernel_threads
 import numpy as np
-from scipy.spatial import KDTree
 from typing import List
 
 
 class BoidManager:
     """
-    A class responsible for managing Boids and their interactions using KD-Tree 
-    for efficient neighbor searches.
+    A class responsible for managing Boids and their interactions using a uniform
+    grid (cell list) for efficient neighbor searches.
 
-    The KD-Tree significantly improves the performance of nearest neighbor searches, 
-    making it an ideal choice for real-time simulations with a large number of Boids.
+    The simulation space is bounded, wraps around its edges and uses a single
+    search radius, so bucketing the Boids into cells at least as large as that
+    radius makes every neighbor search a scan of the 3x3 cells around a Boid,
+    with no tree to build.
+
+    Boid positions and velocities are stored as two contiguous (N, 2) float32
+    arrays (structure of arrays), so the flocking rules are evaluated for the
+    whole flock by a single Numba-compiled kernel per frame.
     """
 
-    def __init__(self, width: int, 
-                 height: int, 
-                 num_boids: int, 
-                 boid_height: float, 
-                 boid_width: float, 
+    def __init__(self, width: int,
+                 height: int,
+                 num_boids: int,
+                 boid_height: float,
+                 boid_width: float,
                  max_velocity: float,
                  separation_intensity: float = 3.0,
                  separation_weight: float = 0.5,
                  alignment_weight: float = 0.03,
-                 cohesion_weight: float = 0.001):
+                 cohesion_weight: float = 0.001,
+                 separation_radius: float = 60.0,
+                 alignment_radius: float = 80.0,
+                 cohesion_radius: float = 80.0,
+                 num_threads: int = None):
         """
-        Initializes the BoidManager and sets up the flock and KD-Tree.
+        Initializes the BoidManager and sets up the flock and the grid.
 
         Args:
             width (int): Width of the simulation space.
@@ -35,6 +43,14 @@ class BoidManager:
             boid_height (float): Height of each Boid (for rendering).
             boid_width (float): Width of each Boid (for rendering).
             max_velocity (float): Maximum velocity magnitude for Boids.
+            separation_intensity (float, optional): Strength of the separation force. Defaults to 3.0.
+            separation_weight (float, optional): Weight of the separation behavior. Defaults to 0.5.
+            alignment_weight (float, optional): Weight of the alignment behavior. Defaults to 0.03.
+            cohesion_weight (float, optional): Weight of the cohesion behavior. Defaults to 0.001.
+            separation_radius (float, optional): Radius for the separation behavior. Defaults to 60.0.
+            alignment_radius (float, optional): Radius for the alignment behavior. Defaults to 80.0.
+            cohesion_radius (float, optional): Radius for the cohesion behavior. Defaults to 80.0.
+            num_threads (int, optional): Threads used by the flocking kernels. Defaults to all cores.
         """
         self.width = width
         self.height = height
@@ -46,73 +62,98 @@ class BoidManager:
         self.separation_weight = separation_weight
         self.alignment_weight = alignment_weight
         self.cohesion_weight = cohesion_weight
+        self.separation_radius = separation_radius
+        self.alignment_radius = alignment_radius
+        self.cohesion_radius = cohesion_radius
+        self.pos = np.empty((num_boids, 2), np.float32, order="C")
+        self.vel = np.empty((num_boids, 2), np.float32, order="C")
+        self._screen_dims = np.array([width, height], np.float32)
+        self._params = np.array([separation_intensity, separation_weight, alignment_weight,
+                                 cohesion_weight, max_velocity], np.float32)
+        self._max_radius = max(separation_radius, alignment_radius, cohesion_radius)
+        self._squared_radii = np.square(np.array([separation_radius, alignment_radius,
+                                                  cohesion_radius], np.float32))
+
+        # Cells are never smaller than the largest radius, so the 3x3 cells around
+        # a Boid contain all of its neighbors, including those across the edges
+        self.grid_shape = (max(1, int(width // self._max_radius)), max(1, int(height // self._max_radius)))
+        self._cell_size = self._screen_dims / np.array(self.grid_shape, np.float32)
+
+        # Per-frame buffers, allocated once and reused by every step. The neighbor
+        # index buffer starts sized for a uniformly spread flock and grows as needed
+        expected_neighbors = num_boids * np.pi * self._max_radius ** 2 / (width * height)
+        self._new_vel = np.empty_like(self.vel)
+        self._cell_start = np.zeros(self.grid_shape[0] * self.grid_shape[1] + 1, np.int32)
+        self._sorted_x = np.empty(num_boids, np.float32)
+        self._sorted_y = np.empty(num_boids, np.float32)
+        self._neighbor_idx = np.empty(int(num_boids * (expected_neighbors + 1)), np.int32)
+        self._neighbor_ptr = np.zeros(num_boids + 1, np.int32)
+
+        if num_threads is not None:
+            set_kernel_threads(num_threads)
+
         self.boids = self.initialize_boids()
-        self.kd_tree = None  # KD-Tree will be updated each frame
 
     def initialize_boids(self) -> List[Boid]:
         """
-        Creates a list of Boids with random positions and velocities.
+        Fills the position/velocity buffers with random values and creates
+        a Boid for every row.
 
         Returns:
             List[Boid]: A list of initialized Boid instances.
         """
-        boids = []
-        for _ in range(self.num_boids):
-            position = Point([
-                np.random.uniform(0, self.width), 
-                np.random.uniform(0, self.height)
-            ])
-            velocity = Vector([
-                np.random.uniform(-1, 1), 
-                np.random.uniform(-1, 1)
-            ]).normalize() * self.max_velocity  # Normalize to max velocity
-            
-            heading = np.arctan2(velocity.components[1], velocity.components[0])
-            boids.append(Boid(self.boid_height, self.boid_width, position, heading, velocity, self.max_velocity,
-                              self.separation_intensity, self.separation_weight, self.alignment_weight, self.cohesion_weight))
-        return boids
-
-    def update_kdtree(self) -> None:
+        rng = np.random.default_rng()
+        self.pos[:] = rng.uniform([0, 0], [self.width, self.height], size=(self.num_boids, 2))
+
+        velocity = rng.uniform(-1, 1, size=(self.num_boids, 2))
+        self.vel[:] = velocity * (self.max_velocity / np.linalg.norm(velocity, axis=1, keepdims=True))  # Normalize to max velocity
+
+        return [Boid(self.boid_height, self.boid_width, self.pos[i], self.vel[i])
+                for i in range(self.num_boids)]
+
+    def update_grid(self) -> None:
         """
-        Updates the KD-Tree with the current Boid positions.
+        Buckets the Boids into the grid and refreshes their neighbor lists.
 
-        Why use KD-Tree?
-        ----------------
-        - A naive approach for finding nearest neighbors requires checking each Boid 
+        Why use a uniform grid?
+        -----------------------
+        - A naive approach for finding nearest neighbors requires checking each Boid
           against all others, which results in O(n²) complexity.
-        - KD-Tree reduces this to **O(log n)** for queries, making neighbor searches 
-          significantly faster in large-scale simulations.
+        - With cells as large as the search radius, each Boid only checks the Boids
+          in its own and the 8 surrounding cells, which is **O(1)** per Boid on
+          average, and building the grid is a single sort.
         """
-        positions = np.array([boid.position.coordinates for boid in self.boids])
-        self.kd_tree = KDTree(positions)
-
-    def get_neighbors(self, boid: Boid, radius: float) -> List[Boid]:
+        cells, order, cell_start = build_cell_list(self.pos, self._cell_size, self.grid_shape,
+                                                   self._cell_start)
+        self._neighbor_idx = grid_neighbors(
+            self.pos, cells, order, cell_start, *self.grid_shape,
+            self._screen_dims, np.float32(self._max_radius ** 2),
+            self._sorted_x, self._sorted_y, self._neighbor_idx, self._neighbor_ptr)
+
+    def step(self) -> None:
         """
-        Retrieves neighboring Boids within a given radius using KD-Tree.
+        Advances the whole flock by one frame.
 
-        Args:
-            boid (Boid): The Boid for which we are finding neighbors.
-            radius (float): The search radius.
-
-        Returns:
-            List[Boid]: A list of neighboring Boids within the radius.
+        Separation, alignment and cohesion are computed for every Boid at once
+        by the compiled flock_step kernel from CSR neighbor lists, then
+        positions are integrated and wrapped in place. Only the small cell-list
+        arrays in build_cell_list are allocated per frame.
         """
-        if self.kd_tree is None:
-            return []  # No KD-Tree available yet
+        self.update_grid()
 
-        # Find indices of neighbors using KD-Tree query
-        neighbor_indices = self.kd_tree.query_ball_point(boid.position.coordinates, radius)
+        flock_step(self.pos, self.vel, self._neighbor_idx, self._neighbor_ptr,
+                   self._screen_dims, self._squared_radii, self._params, self._new_vel)
 
-        # Filter out the Boid itself from its neighbor list
-        return [self.boids[i] for i in neighbor_indices if self.boids[i] != boid]
+        # Update velocity and position
+        self.vel[:] = self._new_vel
+        self.pos += self.vel
+        self.apply_screen_wrap()
 
-    def apply_screen_wrap(self, boid: Boid) -> None:
+    def apply_screen_wrap(self) -> None:
         """
         Implements toroidal (wrap-around) boundary conditions.
 
         If a Boid moves past one edge of the screen, it appears on the opposite side.
-
-        Args:
-            boid (Boid): The Boid to apply the wrapping logic to.
+        The whole position buffer is wrapped with a single np.mod call.
         """
-        boid.position.coordinates = np.mod(boid.position.coordinates, [self.width, self.height])
+        np.mod(self.pos, self._screen_dims, out=self.pos)
@@ -1,4 +1,5 @@
 import argparse
+import os
 
 def get_config():
     """
@@ -27,6 +28,9 @@ def get_config():
     parser.add_argument("--alignment-weight", dest="alignment_weight", type=float, default=0.03, help="Weight of alignment behavior")
     parser.add_argument("--cohesion-weight", dest="cohesion_weight", type=float, default=0.001, help="Weight of cohesion behavior")
 
+    # Parallelism
+    parser.add_argument("--num-threads", dest="num_threads", type=int, default=os.cpu_count(), help="Number of threads used by the flocking kernels")
+
     # Interaction radii
     parser.add_argument("--separation-radius", dest="separation_radius", type=float, default=60, help="Radius for separation force")
     parser.add_argument("--alignment-radius", dest="alignment_radius", type=float, default=80, help="Radius for alignment force")
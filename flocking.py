@@ -0,0 +1,291 @@
+import math
+import numpy as np
+from numba import config, njit, prange, set_num_threads
+
+
+def set_kernel_threads(num_threads: int) -> None:
+    """
+    Sets how many threads the parallel kernels split their Boids across.
+
+    Args:
+        num_threads (int): Requested number of threads, capped at the size of numba's thread pool.
+    """
+    set_num_threads(max(1, min(num_threads, config.NUMBA_NUM_THREADS)))
+
+
+def build_cell_list(pos: np.ndarray, cell_size: np.ndarray, grid_shape: tuple[int, int],
+                    cell_start: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Buckets the Boids into a uniform grid of cells covering the simulation space.
+
+    The Boids in cell c are order[cell_start[c]:cell_start[c + 1]].
+
+    Args:
+        pos (np.ndarray): (N, 2) Boid positions, already wrapped into the simulation space.
+        cell_size (np.ndarray): Width and height of a cell.
+        grid_shape (tuple[int, int]): Number of cells along x and y.
+        cell_start (np.ndarray): Zero-initialized int32 buffer of one entry per cell
+            plus one, reused across frames; its first entry is never written.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The cell of every Boid, the Boid
+        indices sorted by cell and the start offset of every cell.
+    """
+    grid_x, grid_y = grid_shape
+    cell_xy = (pos / cell_size).astype(np.int32)
+    # A position rounded up to the far edge belongs to the first cell
+    cells = (cell_xy[:, 0] % grid_x) * grid_y + cell_xy[:, 1] % grid_y
+
+    order = np.argsort(cells, kind="stable").astype(np.int32)
+    np.cumsum(np.bincount(cells, minlength=grid_x * grid_y), out=cell_start[1:])
+    return cells, order, cell_start
+
+
+@njit(inline="always")
+def _wrap_delta(d, extent, half_extent):
+    """Shortest signed difference along one axis of the wrap-around space."""
+    if d > half_extent:
+        return d - extent
+    if d < -half_extent:
+        return d + extent
+    return d
+
+
+@njit(inline="always")
+def _neighbor_cell(cell, offset, grid_size, extent):
+    """
+    Steps from a cell along one axis of the grid, wrapping around its edges.
+
+    Returns the reached cell and the shift that moves a query point next to it
+    when the step wrapped.
+    """
+    cell += offset
+    if cell < 0:
+        return cell + grid_size, extent
+    if cell >= grid_size:
+        return cell - grid_size, -extent
+    return cell, extent - extent
+
+
+@njit(parallel=True, cache=True)
+def grid_neighbors(pos, cells, order, cell_start, grid_x, grid_y, world, squared_radius,
+                   xs, ys, idx, ptr):
+    """
+    Finds the neighbors of every Boid within a radius by scanning the 3x3 block
+    of grid cells around it, wrapping around the edges of the simulation space.
+
+    The positions are first gathered in cell order into separate, contiguous x
+    and y arrays, so scanning a cell reads consecutive float32 values and the
+    distance test compiles to SIMD instructions. Cells across an edge are
+    reached by shifting the query point by the size of the space instead of
+    wrapping every distance, which keeps the inner loop branch-free.
+
+    The kernel is compiled without fastmath: the fill pass writes exactly as
+    many neighbors as the count pass found only if both passes make the same
+    distance decisions, which contracting the distance into a fused
+    multiply-add in one of them would break.
+
+    Cells must be at least as large as the radius. Each Boid is left out of its
+    own neighbor list.
+
+    All buffers are owned by the caller and reused across frames. The neighbor
+    index buffer is only replaced, with some headroom, when the lists no
+    longer fit in it.
+
+    Args:
+        pos (np.ndarray): (N, 2) Boid positions.
+        cells, order, cell_start (np.ndarray): The cell list from build_cell_list.
+        grid_x, grid_y (int): Number of cells along x and y.
+        world (np.ndarray): Width and height of the simulation space.
+        squared_radius (float): Squared search radius.
+        xs, ys (np.ndarray): (N,) float32 scratch buffers for the sorted positions.
+        idx (np.ndarray): int32 buffer receiving the CSR neighbor indices.
+        ptr (np.ndarray): (N + 1,) int32 buffer receiving the CSR row pointers.
+
+    Returns:
+        np.ndarray: The buffer holding the neighbor indices, idx itself unless it
+        had to grow; the neighbors of Boid i are idx[ptr[i]:ptr[i + 1]].
+    """
+    num_boids = pos.shape[0]
+    width = world[0]
+    height = world[1]
+    half_width = width / np.float32(2.0)
+    half_height = height / np.float32(2.0)
+
+    # With fewer than 3 cells along an axis the block would visit a cell twice,
+    # so such axes scan every cell once and wrap each distance instead of
+    # shifting the query point
+    last_x = min(2, grid_x - 1)
+    last_y = min(2, grid_y - 1)
+    wrap_x = grid_x < 3
+    wrap_y = grid_y < 3
+
+    # A position at or just below the far edge can round into the first cell,
+    # so along the shifted axes a coordinate in the first cell but beyond the
+    # middle of the space is folded back by the extent to be measured from there
+    for k in range(num_boids):
+        i = order[k]
+        xs[k] = pos[i, 0]
+        ys[k] = pos[i, 1]
+        if not wrap_x and cells[i] // grid_y == 0 and xs[k] > half_width:
+            xs[k] -= width
+        if not wrap_y and cells[i] % grid_y == 0 and ys[k] > half_height:
+            ys[k] -= height
+
+    # Two passes over the same cells: count the neighbors, then fill them in
+    for s in prange(num_boids):
+        i = order[s]
+        n = 0
+        for off_x in range(-1, last_x):
+            cell_x, shift_x = _neighbor_cell(cells[i] // grid_y, off_x, grid_x, width)
+            qx = xs[s] if wrap_x else xs[s] + shift_x
+            for off_y in range(-1, last_y):
+                cell_y, shift_y = _neighbor_cell(cells[i] % grid_y, off_y, grid_y, height)
+                qy = ys[s] if wrap_y else ys[s] + shift_y
+                cell = cell_x * grid_y + cell_y
+                for k in range(cell_start[cell], cell_start[cell + 1]):
+                    dx = qx - xs[k]
+                    dy = qy - ys[k]
+                    if wrap_x:
+                        dx = _wrap_delta(dx, width, half_width)
+                    if wrap_y:
+                        dy = _wrap_delta(dy, height, half_height)
+                    n += np.int32(dx * dx + dy * dy <= squared_radius)
+        ptr[i + 1] = n - 1  # The Boid itself was counted
+
+    ptr[0] = 0
+    for i in range(num_boids):
+        ptr[i + 1] += ptr[i]
+    if ptr[num_boids] > idx.shape[0]:
+        idx = np.empty(ptr[num_boids] + ptr[num_boids] // 2, dtype=np.int32)
+
+    for s in prange(num_boids):
+        i = order[s]
+        n = ptr[i]
+        for off_x in range(-1, last_x):
+            cell_x, shift_x = _neighbor_cell(cells[i] // grid_y, off_x, grid_x, width)
+            qx = xs[s] if wrap_x else xs[s] + shift_x
+            for off_y in range(-1, last_y):
+                cell_y, shift_y = _neighbor_cell(cells[i] % grid_y, off_y, grid_y, height)
+                qy = ys[s] if wrap_y else ys[s] + shift_y
+                cell = cell_x * grid_y + cell_y
+                for k in range(cell_start[cell], cell_start[cell + 1]):
+                    dx = qx - xs[k]
+                    dy = qy - ys[k]
+                    if wrap_x:
+                        dx = _wrap_delta(dx, width, half_width)
+                    if wrap_y:
+                        dy = _wrap_delta(dy, height, half_height)
+                    if dx * dx + dy * dy <= squared_radius and k != s:
+                        idx[n] = order[k]
+                        n += 1
+    return idx
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def flock_step(pos, vel, idx, ptr, world, squared_radii, params, out):
+    """
+    Applies separation, alignment and cohesion to every Boid and writes the
+    resulting velocities, limited to max_velocity, into out.
+
+    The neighbor lists are found once with the largest radius and walked in a
+    single pass: each neighbor's squared distance is computed once and
+    compared with the radius of every rule. Distances wrap around the edges of
+    the simulation space.
+
+    The new velocities go to a separate buffer because other threads are still
+    reading vel for their own alignment while the kernel runs.
+
+    Args:
+        pos (np.ndarray): (N, 2) Boid positions.
+        vel (np.ndarray): (N, 2) Boid velocities.
+        idx, ptr (np.ndarray): CSR neighbor lists within the largest radius.
+        world (np.ndarray): Width and height of the simulation space.
+        squared_radii (np.ndarray): Squared separation, alignment and cohesion radii.
+        params (np.ndarray): separation intensity, separation weight, alignment weight,
+            cohesion weight and max velocity, in that order.
+        out (np.ndarray): (N, 2) buffer receiving the new velocities.
+    """
+    intensity = params[0]
+    separation_weight = params[1]
+    alignment_weight = params[2]
+    cohesion_weight = params[3]
+    max_velocity = params[4]
+    separation_r2 = squared_radii[0]
+    alignment_r2 = squared_radii[1]
+    cohesion_r2 = squared_radii[2]
+
+    # Keep every local in float32: mixing in float64 literals or integer
+    # divisions would promote the whole kernel to float64
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    width = world[0]
+    height = world[1]
+    half_width = width / np.float32(2.0)
+    half_height = height / np.float32(2.0)
+
+    for i in prange(pos.shape[0]):
+        px = pos[i, 0]
+        py = pos[i, 1]
+        vx = vel[i, 0]
+        vy = vel[i, 1]
+
+        # Single pass over the neighbors accumulating all three rules
+        fx = zero
+        fy = zero
+        ax = zero
+        ay = zero
+        cx = zero
+        cy = zero
+        n_separation = 0
+        n_alignment = 0
+        n_cohesion = 0
+        for j_ptr in range(ptr[i], ptr[i + 1]):
+            j = idx[j_ptr]
+            dx = _wrap_delta(px - pos[j, 0], width, half_width)
+            dy = _wrap_delta(py - pos[j, 1], height, half_height)
+            d2 = dx * dx + dy * dy
+
+            # Separation: repulsion decaying with the distance
+            if d2 <= separation_r2:
+                n_separation += 1
+                if d2 > zero:
+                    repulsion = intensity / d2
+                    fx += dx * repulsion
+                    fy += dy * repulsion
+
+            # Alignment: average velocity of the neighbors
+            if d2 <= alignment_r2:
+                n_alignment += 1
+                ax += vel[j, 0]
+                ay += vel[j, 1]
+
+            # Cohesion: neighbor position relative to the Boid, across the edges if closer
+            if d2 <= cohesion_r2:
+                n_cohesion += 1
+                cx -= dx
+                cy -= dy
+
+        # Average each force over its neighbors and combine them
+        if n_separation > 0:
+            inv_n = one / np.float32(n_separation)
+            vx += fx * inv_n * separation_weight
+            vy += fy * inv_n * separation_weight
+        if n_alignment > 0:
+            inv_n = one / np.float32(n_alignment)
+            vx += (ax * inv_n - vel[i, 0]) * alignment_weight
+            vy += (ay * inv_n - vel[i, 1]) * alignment_weight
+        if n_cohesion > 0:
+            inv_n = one / np.float32(n_cohesion)
+            vx += cx * inv_n * cohesion_weight
+            vy += cy * inv_n * cohesion_weight
+
+        # Limit the velocity to max_velocity
+        speed2 = vx * vx + vy * vy
+        if speed2 > zero:
+            inv = max_velocity / math.sqrt(speed2)
+            vx *= inv
+            vy *= inv
+
+        out[i, 0] = vx
+        out[i, 1] = vy
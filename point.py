@@ -5,6 +5,8 @@ from vector import Vector
 class Point:
     """Represents a 2D point with basic vector operations."""
 
+    __slots__ = ("coordinates",)
+
     def __init__(self, coordinates: list[float] | tuple[float, float] | np.ndarray):
         """
         Initializes a Point object.
@@ -17,7 +19,22 @@ class Point:
         """
         if not isinstance(coordinates, (list, tuple, np.ndarray)) or len(coordinates) != 2:
             raise ValueError("coordinates must be a list, tuple, or numpy array of length 2")
-        self.coordinates = np.array(coordinates, dtype=float)
+        self.coordinates = np.asarray(coordinates, dtype=np.float32)
+
+    @classmethod
+    def _fast_new(cls, coordinates: np.ndarray) -> "Point":
+        """
+        Wraps a 2-element float32 array without validating or copying it.
+
+        Args:
+            coordinates (np.ndarray): The array to wrap. It is shared, not copied.
+
+        Returns:
+            Point: A Point backed by the given array.
+        """
+        point = cls.__new__(cls)
+        point.coordinates = coordinates
+        return point
 
     def __repr__(self) -> str:
         """Returns a string representation of the Point object."""
@@ -34,11 +51,10 @@ class Point:
             Point: A new Point representing the sum.
         
         Raises:
-            TypeError: If the operand is not a Point instance.
+            AssertionError: If the operand is not a Point instance (checked only when assertions are enabled).
         """
-        if not isinstance(other, Point):
-            raise TypeError("Operand must be an instance of Point")
-        return Point(self.coordinates + other.coordinates)
+        assert isinstance(other, Point), "Operand must be an instance of Point"
+        return Point._fast_new(self.coordinates + other.coordinates)
 
     def __sub__(self, other: "Point") -> "Vector":
         """
@@ -51,11 +67,10 @@ class Point:
             Vector: A new Vector representing the difference.
         
         Raises:
-            TypeError: If the operand is not a Point instance.
+            AssertionError: If the operand is not a Point instance (checked only when assertions are enabled).
         """
-        if not isinstance(other, Point):
-            raise TypeError("Operand must be an instance of Point")
-        return Vector(self.coordinates - other.coordinates)
+        assert isinstance(other, Point), "Operand must be an instance of Point"
+        return Vector._fast_new(self.coordinates - other.coordinates)
 
     def __mul__(self, scalar: float) -> "Point":
         """
@@ -68,11 +83,10 @@ class Point:
             Point: A new Point scaled by the scalar.
         
         Raises:
-            TypeError: If the operand is not a float or int.
+            AssertionError: If the operand is not a float or int (checked only when assertions are enabled).
         """
-        if not isinstance(scalar, (int, float)):
-            raise TypeError("Operand must be a scalar (int or float)")
-        return Point(self.coordinates * scalar)
+        assert isinstance(scalar, (int, float)), "Operand must be a scalar (int or float)"
+        return Point._fast_new(self.coordinates * scalar)
 
     def __rmul__(self, scalar: float) -> "Point":
         """
@@ -1,12 +1,67 @@
+import math
 import pygame
 import pygame.gfxdraw
 from config import CONFIG
+from boid import Boid
 from boidmanager import BoidManager
+from typing import List
 
 # Pygame Configuration
 screen = pygame.display.set_mode((CONFIG.screen_width, CONFIG.screen_height))
 pygame.display.set_caption("Boid Simulation")
 
+# Heading resolution of the Boid sprites: 256 bins of ~1.4 degrees, visually
+# indistinguishable from exact headings
+HEADING_BINS = 256
+_COS = [math.cos(math.tau * k / HEADING_BINS) for k in range(HEADING_BINS)]
+_SIN = [math.sin(math.tau * k / HEADING_BINS) for k in range(HEADING_BINS)]
+
+
+def heading_bin(heading: float) -> int:
+    """
+    Quantizes a heading into the index of the closest heading bin.
+
+    Args:
+        heading (float): Heading angle in radians.
+
+    Returns:
+        int: Index into the sin/cos tables and the sprite list.
+    """
+    return int((heading % math.tau) * (HEADING_BINS / math.tau) + 0.5) & (HEADING_BINS - 1)
+
+
+def build_boid_sprites(height: float, width: float, color: tuple) -> List[tuple]:
+    """
+    Pre-renders the Boid triangle for every heading bin.
+
+    Args:
+        height (float): Height of the Boid.
+        width (float): Width of the Boid.
+        color (tuple): RGB color of the Boid.
+
+    Returns:
+        List[tuple]: For every heading bin, the sprite and the offset from the
+        Boid's position to the sprite's top-left corner.
+    """
+    size = 2 * math.ceil(max(height, width)) + 2
+    center = size / 2
+
+    sprites = []
+    for k in range(HEADING_BINS):
+        # Triangle around the center of the surface, drawn directly at the bin's
+        # heading so its anti-aliased edges are not resampled by a rotation
+        cos_h, sin_h = _COS[k], _SIN[k]
+        vertices = [
+            (center + height * cos_h, center + height * sin_h),
+            (center - width * sin_h, center + width * cos_h),
+            (center + width * sin_h, center - width * cos_h)
+        ]
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.gfxdraw.aapolygon(sprite, vertices, color)
+        pygame.gfxdraw.filled_polygon(sprite, vertices, color)
+        sprites.append((sprite, (center, center)))
+    return sprites
+
 
 def run_simulation() -> None:
     """
@@ -14,11 +69,12 @@ def run_simulation() -> None:
 
     The simulation continuously updates the Boid positions and their interactions,
     applying flocking behavior rules (separation, alignment, cohesion) while using 
-    a KD-Tree for efficient neighbor searches.
+    a uniform grid for efficient neighbor searches.
     """
     pygame.init()
     clock = pygame.time.Clock()
     is_running = True
+    boid_sprites = build_boid_sprites(CONFIG.boid_height, CONFIG.boid_width, Boid.color)
 
     # Initialize the BoidManager with simulation parameters
     boid_manager = BoidManager(
@@ -31,7 +87,11 @@ def run_simulation() -> None:
         separation_intensity=CONFIG.separation_intensity,
         separation_weight=CONFIG.separation_weight,
         alignment_weight=CONFIG.alignment_weight,
-        cohesion_weight=CONFIG.cohesion_weight
+        cohesion_weight=CONFIG.cohesion_weight,
+        separation_radius=CONFIG.separation_radius,
+        alignment_radius=CONFIG.alignment_radius,
+        cohesion_radius=CONFIG.cohesion_radius,
+        num_threads=CONFIG.num_threads
     )
 
     while is_running:
@@ -43,22 +103,17 @@ def run_simulation() -> None:
             if event.type == pygame.QUIT:
                 is_running = False
 
-        # Update KD-Tree for efficient neighbor queries
-        boid_manager.update_kdtree()
+        # Apply the flocking rules to the whole flock at once
+        boid_manager.step()
 
+        # Render every Boid with the pre-rotated sprite closest to its heading
+        blits = []
         for boid in boid_manager.boids:
-            # Retrieve different groups of neighbors for each flocking rule
-            neighbors_separation = boid_manager.get_neighbors(boid, radius=CONFIG.separation_radius)
-            neighbors_alignment = boid_manager.get_neighbors(boid, radius=CONFIG.alignment_radius)
-            neighbors_cohesion = boid_manager.get_neighbors(boid, radius=CONFIG.cohesion_radius)
-
-            # Update Boid movement based on flocking rules
-            boid.update(neighbors_separation, neighbors_alignment, neighbors_cohesion)
-            boid_manager.apply_screen_wrap(boid)
-
-            # Render Boid with anti-aliased edges
-            pygame.gfxdraw.aapolygon(screen, boid.vertices, boid.color)
-            pygame.gfxdraw.filled_polygon(screen, boid.vertices, boid.color)
+            boid.update()
+            sprite, (half_width, half_height) = boid_sprites[heading_bin(boid.heading)]
+            x, y = boid.position.coordinates.tolist()
+            blits.append((sprite, (x - half_width, y - half_height)))
+        screen.blits(blits, doreturn=False)
 
         pygame.display.flip()
 
@@ -0,0 +1,145 @@
+import unittest
+import numpy as np
+from boidmanager import BoidManager
+
+
+def brute_force_neighbors(pos: np.ndarray, world: np.ndarray, radius: float) -> list[set[int]]:
+    """
+    Finds the neighbors of every Boid by checking it against all the others,
+    using the shortest distance across the edges of the simulation space.
+
+    Args:
+        pos (np.ndarray): (N, 2) Boid positions.
+        world (np.ndarray): Width and height of the simulation space.
+        radius (float): Search radius.
+
+    Returns:
+        list[set[int]]: The indices of the neighbors of every Boid, itself excluded.
+    """
+    pos = pos.astype(np.float64)
+    neighbors = []
+    for i in range(len(pos)):
+        d = pos - pos[i]
+        d = (d + world / 2) % world - world / 2
+        within = np.flatnonzero(np.einsum("ij,ij->i", d, d) <= radius ** 2)
+        neighbors.append(set(within.tolist()) - {i})
+    return neighbors
+
+
+def reference_velocities(pos: np.ndarray, vel: np.ndarray, world: np.ndarray, radii: tuple[float, float, float],
+                         params: tuple[float, float, float, float, float]) -> np.ndarray:
+    """
+    Computes the velocities after one step of the flocking rules with plain NumPy,
+    checking every Boid against all the others.
+
+    Args:
+        pos (np.ndarray): (N, 2) Boid positions.
+        vel (np.ndarray): (N, 2) Boid velocities.
+        world (np.ndarray): Width and height of the simulation space.
+        radii (tuple[float, float, float]): Separation, alignment and cohesion radii.
+        params (tuple[float, float, float, float, float]): separation intensity, separation
+            weight, alignment weight, cohesion weight and max velocity, in that order.
+
+    Returns:
+        np.ndarray: (N, 2) new velocities.
+    """
+    intensity, separation_weight, alignment_weight, cohesion_weight, max_velocity = params
+    pos = pos.astype(np.float64)
+    vel = vel.astype(np.float64)
+    new_vel = np.empty_like(vel)
+    for i in range(len(pos)):
+        d = pos[i] - pos
+        d = (d + world / 2) % world - world / 2
+        d2 = np.einsum("ij,ij->i", d, d)
+        others = np.arange(len(pos)) != i
+        separation, alignment, cohesion = (others & (d2 <= r ** 2) for r in radii)
+
+        v = vel[i].copy()
+        if separation.any():
+            repelling = separation & (d2 > 0)
+            force = (d[repelling] * (intensity / d2[repelling])[:, None]).sum(axis=0)
+            v += force / separation.sum() * separation_weight
+        if alignment.any():
+            v += (vel[alignment].mean(axis=0) - vel[i]) * alignment_weight
+        if cohesion.any():
+            v += -d[cohesion].mean(axis=0) * cohesion_weight
+        new_vel[i] = v * (max_velocity / np.hypot(*v))
+    return new_vel
+
+
+def grid_neighbor_sets(manager: BoidManager) -> list[set[int]]:
+    """Rebuilds the grid of a BoidManager and returns its neighbor lists as sets."""
+    manager.update_grid()
+    idx, ptr = manager._neighbor_idx, manager._neighbor_ptr
+    return [set(idx[ptr[i]:ptr[i + 1]].tolist()) for i in range(manager.num_boids)]
+
+
+class TestGridNeighbors(unittest.TestCase):
+    """Checks the uniform grid neighbor search against a brute-force search."""
+
+    RADIUS = 80.0  # Largest of the default BoidManager radii
+
+    def make_manager(self, width: float, height: float, pos: np.ndarray) -> BoidManager:
+        manager = BoidManager(width, height, len(pos), 10, 3, 2.0)
+        manager.pos[:] = pos
+        return manager
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        for grid_shape in [(1, 1), (2, 1), (3, 3), (10, 7)]:
+            world = np.array(grid_shape, np.float64) * self.RADIUS
+            with self.subTest(grid_shape=grid_shape):
+                pos = rng.uniform([0, 0], world, size=(300, 2))
+                manager = self.make_manager(*world, pos)
+                self.assertEqual(manager.grid_shape, grid_shape)
+                self.assertEqual(grid_neighbor_sets(manager),
+                                 brute_force_neighbors(manager.pos, world, self.RADIUS))
+
+    def test_matches_brute_force_with_inexact_cells(self):
+        # Cell sizes that are not exact in float32, with some Boids one ulp below the far edges
+        rng = np.random.default_rng(1)
+        for width, height in [(242, 600), (1000, 600), (130, 250)]:
+            world = np.array([width, height], np.float64)
+            with self.subTest(world=(width, height)):
+                pos = rng.uniform([0, 0], world, size=(300, 2)).astype(np.float32)
+                pos[:20, 0] = np.nextafter(np.float32(width), np.float32(0))
+                pos[20:40, 1] = np.nextafter(np.float32(height), np.float32(0))
+                manager = self.make_manager(width, height, pos)
+                self.assertEqual(grid_neighbor_sets(manager),
+                                 brute_force_neighbors(manager.pos, world, self.RADIUS))
+
+    def test_position_on_far_edge(self):
+        # np.mod in float32 can wrap a position to exactly, or one ulp below, the width or height
+        for width, height in [(800, 600), (242, 600), (600, 242)]:
+            for edge_x, edge_y in [(width, height),
+                                   (np.nextafter(np.float32(width), np.float32(0)),
+                                    np.nextafter(np.float32(height), np.float32(0)))]:
+                for pos in ([[edge_x, 100], [5, 100], [edge_x - 10, 100]],
+                            [[100, edge_y], [100, 5], [100, edge_y - 10]]):
+                    with self.subTest(world=(width, height), pos=pos):
+                        manager = self.make_manager(width, height, np.array(pos, np.float32))
+                        self.assertEqual(grid_neighbor_sets(manager), [{1, 2}, {0, 2}, {0, 1}])
+
+
+
+class TestFlockStep(unittest.TestCase):
+    """Checks the fused flocking kernel against a brute-force NumPy step."""
+
+    def test_matches_reference(self):
+        rng = np.random.default_rng(2)
+        radii = (60.0, 80.0, 80.0)
+        params = (100.0, 1.0, 0.03, 0.001, 2.0)
+        for width, height in [(800, 600), (242, 150)]:
+            with self.subTest(world=(width, height)):
+                manager = BoidManager(width, height, 300, 10, 3, params[4], *params[:4], *radii)
+                manager.pos[:] = rng.uniform([0, 0], [width, height], size=(300, 2))
+                manager.pos[1] = manager.pos[0]  # Coincident Boids must not blow up separation
+                pos, vel = manager.pos.copy(), manager.vel.copy()
+
+                manager.step()
+                expected = reference_velocities(pos, vel, np.array([width, height], np.float64), radii, params)
+                np.testing.assert_allclose(manager.vel, expected, atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
+from math import hypot
 import numpy as np
 
 
 class Vector:
     """A 2D vector class with basic vector operations."""
 
+    __slots__ = ("components",)
+
     def __init__(self, components: list | tuple | np.ndarray):
         """
         Initializes a Vector with two components.
@@ -17,7 +20,22 @@ class Vector:
         if not isinstance(components, (list, tuple, np.ndarray)) or len(components) != 2:
             raise ValueError("components must be a list, tuple, or numpy array of length 2")
         
-        self.components = np.array(components, dtype=float)
+        self.components = np.asarray(components, dtype=np.float32)
+
+    @classmethod
+    def _fast_new(cls, components: np.ndarray) -> "Vector":
+        """
+        Wraps a 2-element float32 array without validating or copying it.
+
+        Args:
+            components (np.ndarray): The array to wrap. It is shared, not copied.
+
+        Returns:
+            Vector: A Vector backed by the given array.
+        """
+        vector = cls.__new__(cls)
+        vector.components = components
+        return vector
 
     def __repr__(self) -> str:
         """Returns a string representation of the vector."""
@@ -34,11 +52,10 @@ class Vector:
             Vector: The resulting vector after addition.
 
         Raises:
-            TypeError: If the operand is not an instance of Vector.
+            AssertionError: If the operand is not an instance of Vector (checked only when assertions are enabled).
         """
-        if not isinstance(other, Vector):
-            raise TypeError("Operand must be an instance of Vector")
-        return Vector(self.components + other.components)
+        assert isinstance(other, Vector), "Operand must be an instance of Vector"
+        return Vector._fast_new(self.components + other.components)
 
     def __sub__(self, other: "Vector") -> "Vector":
         """
@@ -51,11 +68,10 @@ class Vector:
             Vector: The resulting vector after subtraction.
 
         Raises:
-            TypeError: If the operand is not an instance of Vector.
+            AssertionError: If the operand is not an instance of Vector (checked only when assertions are enabled).
         """
-        if not isinstance(other, Vector):
-            raise TypeError("Operand must be an instance of Vector")
-        return Vector(self.components - other.components)
+        assert isinstance(other, Vector), "Operand must be an instance of Vector"
+        return Vector._fast_new(self.components - other.components)
 
     def __mul__(self, scalar: float) -> "Vector":
         """
@@ -68,11 +84,10 @@ class Vector:
             Vector: The resulting vector after scaling.
 
         Raises:
-            TypeError: If the operand is not a float or integer.
+            AssertionError: If the operand is not a float or integer (checked only when assertions are enabled).
         """
-        if not isinstance(scalar, (int, float)):
-            raise TypeError("Operand must be a scalar (int or float)")
-        return Vector(self.components * scalar)
+        assert isinstance(scalar, (int, float)), "Operand must be a scalar (int or float)"
+        return Vector._fast_new(self.components * scalar)
 
     def __rmul__(self, scalar: float) -> "Vector":
         """
@@ -101,7 +116,9 @@ class Vector:
         """
         if not isinstance(other, Vector):
             raise TypeError("Operand must be an instance of Vector")
-        return np.dot(self.components, other.components)
+        a = self.components
+        b = other.components
+        return float(a[0] * b[0] + a[1] * b[1])
 
     def magnitude(self) -> float:
         """
@@ -110,7 +127,8 @@ class Vector:
         Returns:
             float: The magnitude of the vector.
         """
-        return np.linalg.norm(self.components)
+        c = self.components
+        return hypot(c[0], c[1])
 
     def normalize(self) -> "Vector":
         """
@@ -122,10 +140,11 @@ class Vector:
         Raises:
             ValueError: If the vector has zero magnitude.
         """
-        mag = self.magnitude()
+        c = self.components
+        mag = hypot(c[0], c[1])
         if mag == 0:
             raise ValueError("Cannot normalize a zero vector")
-        return Vector(self.components / mag)
+        return Vector._fast_new(c / mag)
 
     def perpendicular(self) -> "Vector":
         """